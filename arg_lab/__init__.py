@@ -1,14 +1,26 @@
 """Accumulate–release gradualism simulation and analysis toolkit."""
 
+from . import _precompile  # noqa: F401  (warms up the compiled kernels)
 from .analysis import compute_viability_margin, summarize_cycles
 from .scenarios import Scenario, load_scenarios
-from .simulate import simulate_cycle, simulate_ensemble
+from .simulate import (
+	SimResult,
+	simulate_batch,
+	simulate_cycle,
+	simulate_cycle_arrays,
+	simulate_ensemble,
+	simulate_ensemble_arrays,
+)
 
 __all__ = [
 	"Scenario",
 	"load_scenarios",
+	"SimResult",
+	"simulate_batch",
 	"simulate_cycle",
+	"simulate_cycle_arrays",
 	"simulate_ensemble",
+	"simulate_ensemble_arrays",
 	"summarize_cycles",
 	"compute_viability_margin",
 ]
@@ -0,0 +1,233 @@
+"""Compiled inner loops for the accumulate–release simulator.
+
+The kernels operate on plain NumPy arrays and scalars so that Numba can lower
+them to machine code, and release the GIL while they run so independent
+trajectories can be integrated from several threads. When Numba is not
+installed the same functions run as ordinary Python, which keeps the package
+usable (if slower) without it.
+"""
+
+from __future__ import annotations
+
+import numpy as np
+
+try:
+    from numba import njit, prange
+except ImportError:  # pragma: no cover - exercised only without numba
+    prange = range
+
+    def njit(*args, **kwargs):
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+
+        def decorate(func):
+            return func
+
+        return decorate
+
+
+MODE_LEAKY = 0
+MODE_RATE = 1
+
+
+def _select_sig(real: str) -> str:
+    return f"i8({real}[::1], {real})"
+
+
+def _run_sig(real: str) -> str:
+    array = f"{real}[::1]"
+    return (
+        f"i8({real}, {array}, {real}, i8, {real}, {array}, {array}, {array}, "
+        f"{array}, {array}, u1[::1], {array}, "
+        f"i8[::1], {array}, {array}, {array}, {array}, {array})"
+    )
+
+
+# Explicit signatures compile the serial kernels eagerly (or load them from
+# the on-disk cache) at import; ``::1`` marks unit-stride arrays so loads can
+# be vectorised. Single and double precision variants share one dispatcher
+# each.
+_SELECT_SIGS = [_select_sig("f4"), _select_sig("f8")]
+_RUN_SIGS = [_run_sig("f4"), _run_sig("f8")]
+
+
+@njit(_SELECT_SIGS, cache=True, fastmath=True, boundscheck=False, nogil=True)
+def _select_threshold(theta_arr, value):
+    """Return the index of the highest threshold crossed by ``value``, or -1.
+
+    Equivalent to ``np.searchsorted(theta_arr, value, side="right") - 1`` for
+    ascending ``theta_arr``. Counting crossings instead of breaking out of a
+    scan keeps the loop free of data-dependent branches.
+    """
+
+    sel = -1
+    for j in range(theta_arr.shape[0]):
+        sel += value >= theta_arr[j]
+    return sel
+
+
+def _make_run(leaky: bool, tabulated: bool):
+    """Build the trajectory kernel, specialised on the form of the drive.
+
+    ``leaky`` compiles in the ``- leak * state`` term; without it the base
+    drive is used as is. With ``tabulated`` the base drive is read from
+    ``base[idx - 1]`` at every step (noisy or piecewise drives). Otherwise
+    ``base`` holds a single constant rate and the compiled loop carries no
+    drive stream at all.
+    """
+
+    @njit(_RUN_SIGS, cache=True, fastmath=True, boundscheck=False, nogil=True)
+    def run(
+        leak,
+        base,
+        dt,
+        steps,
+        x0,
+        theta_arr,
+        reset_arr,
+        delta_arr,
+        x_out,
+        order_out,
+        release_out,
+        driver_out,
+        event_idx_out,
+        event_theta_out,
+        event_reset_out,
+        event_delta_out,
+        event_sb_out,
+        event_sa_out,
+    ):
+        """Integrate one trajectory in place and return the number of events.
+
+        ``base`` holds the state-independent part of the drive, noise
+        included; ``leak`` is ignored unless the kernel is leaky.
+        """
+
+        n_events = 0
+        x_out[0] = x0
+        order_out[0] = 0.0
+        rate = base[0]
+
+        for idx in range(1, steps):
+            state = x_out[idx - 1]
+            if tabulated:
+                rate = base[idx - 1]
+            if leaky:
+                derivative = rate - leak * state
+            else:
+                derivative = rate
+            driver_out[idx - 1] = derivative
+            state_next = state + derivative * dt
+
+            # apply the highest threshold reached first
+            sel = _select_threshold(theta_arr, state_next)
+            if sel >= 0:
+                event_idx_out[n_events] = idx
+                event_theta_out[n_events] = theta_arr[sel]
+                event_reset_out[n_events] = reset_arr[sel]
+                event_delta_out[n_events] = delta_arr[sel]
+                event_sb_out[n_events] = state_next
+                event_sa_out[n_events] = reset_arr[sel]
+                n_events += 1
+                state_next = reset_arr[sel]
+                order_out[idx] = order_out[idx - 1] + delta_arr[sel]
+                release_out[idx] = 1
+            else:
+                order_out[idx] = order_out[idx - 1]
+
+            x_out[idx] = state_next if state_next > 0.0 else 0.0
+
+        return n_events
+
+    return run
+
+
+_run_leaky_constant = _make_run(leaky=True, tabulated=False)
+_run_leaky_tabulated = _make_run(leaky=True, tabulated=True)
+_run_rate_constant = _make_run(leaky=False, tabulated=False)
+_run_rate_tabulated = _make_run(leaky=False, tabulated=True)
+
+# keyed on (mode, tabulated)
+_RUN_KERNELS = {
+    (MODE_LEAKY, False): _run_leaky_constant,
+    (MODE_LEAKY, True): _run_leaky_tabulated,
+    (MODE_RATE, False): _run_rate_constant,
+    (MODE_RATE, True): _run_rate_tabulated,
+}
+
+
+def _make_run_ensemble(leaky: bool):
+    """Build a parallel ensemble kernel around the matching tabulated kernel.
+
+    Only the ``leaky`` flag is closed over: Numba keys its on-disk cache on
+    closure contents, so the trajectory kernel is looked up as a module
+    global rather than captured.
+
+    The kernel has no explicit signature, so it is compiled (or loaded from
+    the on-disk cache) on its first call. Loading a ``parallel=True`` kernel
+    starts Numba's threading layer, which must not happen at import: a
+    process that forks afterwards can hang at exit.
+    """
+
+    @njit(cache=True, parallel=True, boundscheck=False, nogil=True)
+    def run_ensemble(
+        leak,
+        base,
+        dt,
+        steps,
+        x0,
+        theta,
+        reset,
+        delta,
+        out_x,
+        out_order,
+        out_release,
+        out_driver,
+    ):
+        """Integrate independent members in parallel, one output row per member.
+
+        ``leak`` has one entry per member; ``base``, ``theta``, ``reset`` and
+        ``delta`` have one row per member. Event records are discarded.
+        """
+
+        if leaky:
+            run = _run_leaky_tabulated
+        else:
+            run = _run_rate_tabulated
+        n_members = base.shape[0]
+        for m in prange(n_members):
+            event_idx = np.empty(steps, dtype=np.int64)
+            event_theta = np.empty_like(out_x[m])
+            event_reset = np.empty_like(out_x[m])
+            event_delta = np.empty_like(out_x[m])
+            event_sb = np.empty_like(out_x[m])
+            event_sa = np.empty_like(out_x[m])
+            run(
+                leak[m],
+                base[m],
+                dt,
+                steps,
+                x0,
+                theta[m],
+                reset[m],
+                delta[m],
+                out_x[m],
+                out_order[m],
+                out_release[m],
+                out_driver[m],
+                event_idx,
+                event_theta,
+                event_reset,
+                event_delta,
+                event_sb,
+                event_sa,
+            )
+
+    return run_ensemble
+
+
+# keyed on mode
+_ENSEMBLE_KERNELS = {
+    MODE_LEAKY: _make_run_ensemble(leaky=True),
+    MODE_RATE: _make_run_ensemble(leaky=False),
+}
@@ -1,13 +1,13 @@
 from __future__ import annotations
 
-from dataclasses import dataclass
-from typing import Iterable, List
+from dataclasses import dataclass, fields
+from typing import Iterable, Sequence
 
 import numpy as np
 import pandas as pd
 
-from .scenarios import Scenario, ThresholdSpec
-from .simulate import Event
+from .scenarios import ThresholdSpec
+from .simulate import Event, EventLog, SimResult
 
 
 @dataclass(frozen=True)
@@ -24,59 +24,70 @@ class CycleSummary:
     reset_level: float
 
 
-def summarize_cycles(frame: pd.DataFrame, events: List[Event], initial_state: float) -> pd.DataFrame:
-    """Return per-cycle statistics using the recorded release events."""
+_SUMMARY_COLUMNS = [field.name for field in fields(CycleSummary)]
+
+
+def summarize_cycles(frame: pd.DataFrame, events: Sequence[Event], initial_state: float) -> pd.DataFrame:
+    """Return per-cycle statistics using the recorded release events.
+
+    ``events`` may be a plain list of :class:`Event` records or the
+    :class:`EventLog` returned by ``simulate_cycle``, whose columns are used
+    directly.
+    """
 
     if not events:
-        return pd.DataFrame(
-            columns=[
-                "start_time",
-                "end_time",
-                "duration",
-                "ramp_amplitude",
-                "mean_slope",
-                "release_gain",
-                "theta",
-                "reset_level",
-            ]
-        )
-
-    summaries: List[CycleSummary] = []
-    last_time = frame["time"].iloc[0]
-    last_state = initial_state
-    last_order = 0.0
-
-    for event in events:
-        duration = event.time - last_time
-        if duration <= 0:
-            duration = np.nan
-        amplitude = event.state_before - last_state
-        mean_slope = amplitude / duration if duration and not np.isnan(duration) else np.nan
-        release_gain = event.delta_s
-        summaries.append(
-            CycleSummary(
-                start_time=last_time,
-                end_time=event.time,
-                duration=duration,
-                ramp_amplitude=amplitude,
-                mean_slope=mean_slope,
-                release_gain=release_gain,
-                theta=event.theta,
-                reset_level=event.reset,
-            )
-        )
-        last_time = event.time
-        last_state = event.reset
-        last_order += event.delta_s
-
-    return pd.DataFrame(summaries)
-
-
-def compute_viability_margin(frame: pd.DataFrame, thresholds: Iterable[ThresholdSpec]) -> dict:
-    """Compute live margin to the highest threshold at the end of the simulation."""
+        return pd.DataFrame(columns=_SUMMARY_COLUMNS)
+
+    if isinstance(events, EventLog):
+        times = np.asarray(events.time, dtype=float)
+        state_before = np.asarray(events.state_before, dtype=float)
+        reset = np.asarray(events.reset, dtype=float)
+        delta_s = np.asarray(events.delta_s, dtype=float)
+        theta = np.asarray(events.theta, dtype=float)
+    else:
+        count = len(events)
+        times = np.fromiter((event.time for event in events), dtype=float, count=count)
+        state_before = np.fromiter((event.state_before for event in events), dtype=float, count=count)
+        reset = np.fromiter((event.reset for event in events), dtype=float, count=count)
+        delta_s = np.fromiter((event.delta_s for event in events), dtype=float, count=count)
+        theta = np.fromiter((event.theta for event in events), dtype=float, count=count)
+
+    # each cycle starts where the previous release left off
+    start_time = np.concatenate(([frame["time"].iloc[0]], times[:-1]))
+    last_state = np.concatenate(([initial_state], reset[:-1]))
+    duration = times - start_time
+    amplitude = state_before - last_state
+    positive = duration > 0
+    with np.errstate(divide="ignore", invalid="ignore"):
+        mean_slope = np.where(positive, amplitude / duration, np.nan)
+    duration = np.where(positive, duration, np.nan)
+
+    return pd.DataFrame(
+        {
+            "start_time": start_time,
+            "end_time": times,
+            "duration": duration,
+            "ramp_amplitude": amplitude,
+            "mean_slope": mean_slope,
+            "release_gain": delta_s,
+            "theta": theta,
+            "reset_level": reset,
+        }
+    )
+
+
+def compute_viability_margin(frame: pd.DataFrame | SimResult, thresholds: Iterable[ThresholdSpec]) -> dict:
+    """Compute live margin to the highest threshold at the end of the simulation.
+
+    ``frame`` may be the trajectory DataFrame or the :class:`SimResult` from
+    ``simulate_cycle_arrays``.
+    """
 
     top_threshold = max(th.theta for th in thresholds)
-    current_state = float(frame["accumulator"].iloc[-1])
+    if isinstance(frame, SimResult):
+        current_state = float(frame.accumulator[-1])
+    else:
+        current_state = float(frame["accumulator"].iloc[-1])
     margin = top_threshold - current_state
     relative = margin / top_threshold if top_threshold != 0 else np.nan
     return {
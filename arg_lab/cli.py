@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import argparse
+from functools import lru_cache
 from pathlib import Path
 from typing import Dict, Iterable
 
@@ -11,7 +12,7 @@ import pandas as pd
 from tabulate import tabulate
 
 from .analysis import compute_viability_margin, summarize_cycles
-from .scenarios import Scenario, load_scenarios
+from .scenarios import DEFAULT_SCENARIO_PATH, Scenario, load_scenarios
 from .simulate import simulate_cycle
 
 
@@ -19,6 +20,18 @@ def _scenario_index(scenarios: Iterable[Scenario]) -> Dict[str, Scenario]:
     return {scenario.id: scenario for scenario in scenarios}
 
 
+@lru_cache(maxsize=1)
+def _cached_index(path: str, mtime_ns: int) -> Dict[str, Scenario]:
+    return _scenario_index(load_scenarios(Path(path)))
+
+
+def _load_index(path: Path = DEFAULT_SCENARIO_PATH) -> Dict[str, Scenario]:
+    """Return the scenario index, rebuilt only when the file changes on disk."""
+
+    path = path.resolve()
+    return _cached_index(str(path), path.stat().st_mtime_ns)
+
+
 def build_parser() -> argparse.ArgumentParser:
     parser = argparse.ArgumentParser(
         description="Run accumulate–release gradualism simulations and analytics.",
@@ -64,9 +77,17 @@ def render_plot(frame: pd.DataFrame, scenario: Scenario, output: Path | None) ->
     ax1.set_ylabel("Accumulator", color="tab:blue")
     ax1.tick_params(axis="y", labelcolor="tab:blue")
 
-    release_times = frame.loc[frame["release"] == 1, "time"].to_numpy()
-    for time in release_times:
-        ax1.axvline(time, color="tab:red", linestyle=":", alpha=0.4)
+    # one LineCollection for all releases, spanning the full axes height like axvline
+    release_times = frame["time"].to_numpy()[frame["release"].to_numpy() == 1]
+    ax1.vlines(
+        release_times,
+        0.0,
+        1.0,
+        transform=ax1.get_xaxis_transform(),
+        colors="tab:red",
+        linestyles=":",
+        alpha=0.4,
+    )
 
     ax2 = ax1.twinx()
     ax2.plot(
@@ -90,7 +111,7 @@ def main(argv: list[str] | None = None) -> None:
     parser = build_parser()
     args = parser.parse_args(argv)
 
-    scenarios = _scenario_index(load_scenarios())
+    scenarios = _load_index()
 
     if args.list:
         print("Available scenarios:\n")
@@ -113,11 +134,11 @@ def main(argv: list[str] | None = None) -> None:
     if cycles.empty:
         print("No release events detected; nothing to summarise.")
     else:
-        formatter = {col: precision for col in cycles.columns if cycles[col].dtype != object}
-        formatted = cycles.copy()
-        for column, digits in formatter.items():
-            formatted[column] = formatted[column].map(lambda v: f"{v:.{digits}g}")
-        print(tabulate(formatted.to_dict("records"), headers="keys", tablefmt="github"))
+        formatted = [
+            {key: (f"{value:.{precision}g}" if isinstance(value, float) else value) for key, value in record.items()}
+            for record in cycles.to_dict("records")
+        ]
+        print(tabulate(formatted, headers="keys", tablefmt="github"))
 
     margin = compute_viability_margin(frame, scenario.thresholds)
     print()
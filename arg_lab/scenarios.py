@@ -1,11 +1,14 @@
 from __future__ import annotations
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
+from functools import lru_cache
 from pathlib import Path
 from typing import List, Sequence
 
 import json
 
+import numpy as np
+
 
 @dataclass(frozen=True)
 class ThresholdSpec:
@@ -25,6 +28,21 @@ class DriverSpec:
     leak: float | None = None
     segments: Sequence[dict] | None = None
     noise_std: float = 0.0
+    seg_ends: np.ndarray = field(init=False, compare=False, repr=False)
+    seg_rates: np.ndarray = field(init=False, compare=False, repr=False)
+
+    def __post_init__(self) -> None:
+        # piecewise segment boundaries and rates, shared read-only
+        segments = self.segments or ()
+        columns = {
+            "seg_ends": np.array([segment["end"] for segment in segments], dtype=np.float64),
+            "seg_rates": np.array([segment["rate"] for segment in segments], dtype=np.float64),
+        }
+        if np.any(np.diff(columns["seg_ends"]) <= 0):
+            raise ValueError("Piecewise segment ends must be strictly increasing")
+        for name, column in columns.items():
+            column.setflags(write=False)
+            object.__setattr__(self, name, column)
 
 
 @dataclass(frozen=True)
@@ -39,20 +57,42 @@ class Scenario:
     initial_state: float
     driver: DriverSpec
     thresholds: Sequence[ThresholdSpec]
+    theta_arr: np.ndarray = field(init=False, compare=False, repr=False)
+    reset_arr: np.ndarray = field(init=False, compare=False, repr=False)
+    delta_arr: np.ndarray = field(init=False, compare=False, repr=False)
+
+    def __post_init__(self) -> None:
+        # threshold columns sorted by ascending theta, shared read-only
+        theta = np.array([th.theta for th in self.thresholds], dtype=np.float64)
+        rank = np.argsort(theta, kind="stable")
+        columns = {
+            "theta_arr": theta,
+            "reset_arr": np.array([th.reset for th in self.thresholds], dtype=np.float64),
+            "delta_arr": np.array([th.delta_s for th in self.thresholds], dtype=np.float64),
+        }
+        for name, column in columns.items():
+            column = column[rank]
+            column.setflags(write=False)
+            object.__setattr__(self, name, column)
 
     @property
     def period_hint(self) -> float:
         """Return a rough period estimate for plotting axes."""
 
         total_driver = self.driver.rate or (
-            self.driver.segments[-1]["rate"] if self.driver.segments else 1.0
+            float(self.driver.seg_rates[-1]) if self.driver.seg_rates.size else 1.0
         )
-        top_threshold = max(th.theta for th in self.thresholds)
+        top_threshold = float(self.theta_arr.max())
         return max((top_threshold - self.initial_state) / max(total_driver, 1e-6), 1e-6)
 
 
-def _load_payload(path: Path) -> dict:
-    with path.open("r", encoding="utf-8") as fh:
+DEFAULT_SCENARIO_PATH = Path(__file__).resolve().parent.parent / "data" / "scenarios.json"
+
+
+@lru_cache(maxsize=4)
+def _load_payload(path: str, mtime_ns: int) -> dict:
+    # mtime_ns is part of the cache key so edits to the file are picked up
+    with open(path, "r", encoding="utf-8") as fh:
         return json.load(fh)
 
 
@@ -63,12 +103,14 @@ def load_scenarios(path: Path | None = None) -> List[Scenario]:
     ----------
     path:
         Optional override for the JSON file path. When omitted the packaged
-        `data/scenarios.json` file is used.
+        `data/scenarios.json` file is used. Parsed files are cached per
+        resolved path and modification time.
     """
 
     if path is None:
-        path = Path(__file__).resolve().parent.parent / "data" / "scenarios.json"
-    payload = _load_payload(path)
+        path = DEFAULT_SCENARIO_PATH
+    path = path.resolve()
+    payload = _load_payload(str(path), path.stat().st_mtime_ns)
     scenarios: List[Scenario] = []
     for entry in payload.get("scenarios", []):
         driver_entry = entry["driver"]
@@ -76,7 +118,8 @@ def load_scenarios(path: Path | None = None) -> List[Scenario]:
             type=str(driver_entry["type"]),
             rate=driver_entry.get("rate"),
             leak=driver_entry.get("leak"),
-            segments=tuple(driver_entry.get("segments", [])),
+            # copied so callers never share the cached payload's dicts
+            segments=tuple(dict(segment) for segment in driver_entry.get("segments", [])),
             noise_std=float(driver_entry.get("noise_std", 0.0)),
         )
         thresholds = tuple(
@@ -1,12 +1,17 @@
 from __future__ import annotations
 
-from dataclasses import dataclass
-from typing import Dict, Iterable, List, Tuple
+import os
+from collections.abc import Sequence as SequenceABC
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, fields
+from functools import partial
+from typing import Dict, Iterable, Iterator, List, Sequence, Tuple
 
 import numpy as np
 import pandas as pd
 
-from .scenarios import DriverSpec, Scenario, ThresholdSpec
+from ._kernels import MODE_LEAKY, MODE_RATE, _ENSEMBLE_KERNELS, _RUN_KERNELS
+from .scenarios import DriverSpec, Scenario
 
 
 @dataclass(frozen=True)
@@ -21,131 +26,342 @@ class Event:
     state_after: float
 
 
-def _piecewise_rate(driver: DriverSpec, time: float) -> float:
-    assert driver.segments is not None
-    for segment in driver.segments:
-        if time <= segment["end"]:
-            return float(segment["rate"])
-    return float(driver.segments[-1]["rate"])
+EVENT_COLUMNS = [field.name for field in fields(Event)]
 
 
-def _driver_derivative(driver: DriverSpec, time: float, state: float) -> float:
+@dataclass(frozen=True, eq=False)
+class EventLog(SequenceABC):
+    """Release events stored as parallel arrays, one per :class:`Event` field.
+
+    Behaves as a read-only sequence of :class:`Event` records, which are built
+    only when accessed, and compares equal to another log or sequence holding
+    the same events; :meth:`to_frame` exposes the columns without creating
+    per-event objects.
+    """
+
+    time: np.ndarray
+    theta: np.ndarray
+    reset: np.ndarray
+    delta_s: np.ndarray
+    state_before: np.ndarray
+    state_after: np.ndarray
+
+    def __len__(self) -> int:
+        return self.time.shape[0]
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return EventLog(*(getattr(self, name)[index] for name in EVENT_COLUMNS))
+        return Event(*(float(getattr(self, name)[index]) for name in EVENT_COLUMNS))
+
+    def __iter__(self) -> Iterator[Event]:
+        for row in zip(*(getattr(self, name).tolist() for name in EVENT_COLUMNS)):
+            yield Event(*row)
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, EventLog):
+            return all(np.array_equal(getattr(self, name), getattr(other, name)) for name in EVENT_COLUMNS)
+        if isinstance(other, SequenceABC):
+            return len(self) == len(other) and all(mine == theirs for mine, theirs in zip(self, other))
+        return NotImplemented
+
+    def to_frame(self) -> pd.DataFrame:
+        """Return the events as a DataFrame with one column per field."""
+
+        return pd.DataFrame({name: getattr(self, name) for name in EVENT_COLUMNS})
+
+
+@dataclass(frozen=True, eq=False)
+class SimResult:
+    """Raw arrays from a single simulated trajectory, one entry per time step."""
+
+    time: np.ndarray
+    accumulator: np.ndarray
+    order_parameter: np.ndarray
+    driver: np.ndarray
+    release: np.ndarray
+    events: EventLog
+
+
+def _precompute_driver(driver: DriverSpec, times: np.ndarray) -> Tuple[int, np.ndarray, float]:
+    """Tabulate the state-independent part of the drive at every time step.
+
+    Returns the kernel mode, the base drive, and the leak coefficient (zero
+    unless the driver is leaky). Constant drives return a single-element base
+    that broadcasts against ``times``.
+    """
+
     if driver.type == "leaky":
         if driver.rate is None or driver.leak is None:
             raise ValueError("Leaky driver requires rate and leak parameters")
-        return driver.rate - driver.leak * state
+        return MODE_LEAKY, np.full(1, float(driver.rate)), float(driver.leak)
     if driver.type == "linear":
         if driver.rate is None:
             raise ValueError("Linear driver requires rate parameter")
-        return driver.rate
+        return MODE_RATE, np.full(1, float(driver.rate)), 0.0
     if driver.type == "piecewise":
-        return _piecewise_rate(driver, time)
+        if not driver.seg_rates.size:
+            raise ValueError("Piecewise driver requires at least one segment")
+        # first segment whose end is at or after t; times past the last end keep its rate
+        segment_index = np.searchsorted(driver.seg_ends, times, side="left")
+        np.minimum(segment_index, driver.seg_rates.shape[0] - 1, out=segment_index)
+        return MODE_RATE, driver.seg_rates[segment_index], 0.0
     raise ValueError(f"Unsupported driver type: {driver.type}")
 
 
-def simulate_cycle(scenario: Scenario, seed: int | None = None) -> Tuple[pd.DataFrame, List[Event]]:
-    """Simulate a single accumulate–release trajectory for the provided scenario."""
+_SUPPORTED_DTYPES = (np.dtype(np.float32), np.dtype(np.float64))
 
+
+def _check_dtype(dtype: np.dtype) -> np.dtype:
+    dtype = np.dtype(dtype)
+    if dtype not in _SUPPORTED_DTYPES:
+        raise ValueError(f"Unsupported dtype: {dtype}")
+    return dtype
+
+
+def _step_count(scenario: Scenario) -> int:
+    return int(np.ceil(scenario.duration / scenario.dt)) + 1
+
+
+def simulate_cycle_arrays(
+    scenario: Scenario,
+    seed: int | None = None,
+    dtype: np.dtype = np.float64,
+) -> SimResult:
+    """Simulate a single accumulate–release trajectory and return raw arrays.
+
+    ``dtype`` selects the precision of the state arrays and may be
+    ``float64`` (default) or ``float32``. Single precision halves memory
+    traffic and suits scenarios with small noise and well-separated
+    thresholds. The time grid, and with it the piecewise drive lookup and
+    event times, always stays in double precision.
+    """
+
+    dtype = _check_dtype(dtype)
+    real = dtype.type
     rng = np.random.default_rng(seed)
-    steps = int(np.ceil(scenario.duration / scenario.dt)) + 1
-    times = np.linspace(0.0, scenario.duration, steps)
-    x = np.zeros(steps)
-    order = np.zeros(steps)
-    releases = np.zeros(steps, dtype=int)
-    driver_values = np.zeros(steps)
-    x[0] = scenario.initial_state
-    order[0] = 0.0
-    events: List[Event] = []
-    thresholds = sorted(scenario.thresholds, key=lambda th: th.theta)
-
-    for idx in range(1, steps):
-        t_prev = times[idx - 1]
-        state = x[idx - 1]
-        derivative = _driver_derivative(scenario.driver, t_prev, state)
-        if scenario.driver.noise_std > 0.0:
-            derivative += rng.normal(scale=scenario.driver.noise_std)
-        driver_values[idx - 1] = derivative
-        state_next = state + derivative * scenario.dt
-
-        crossed: List[ThresholdSpec] = []
-        for threshold in thresholds:
-            if state_next >= threshold.theta:
-                crossed.append(threshold)
-
-        if crossed:
-            # apply the highest threshold reached first
-            selected = crossed[-1]
-            event = Event(
-                time=times[idx],
-                theta=selected.theta,
-                reset=selected.reset,
-                delta_s=selected.delta_s,
-                state_before=state_next,
-                state_after=selected.reset,
-            )
-            events.append(event)
-            state_next = selected.reset
-            order[idx] = order[idx - 1] + selected.delta_s
-            releases[idx] = 1
-        else:
-            order[idx] = order[idx - 1]
-
-        x[idx] = max(state_next, 0.0)
+    steps = _step_count(scenario)
+    times = np.arange(steps, dtype=np.float64) * scenario.dt
+    x = np.zeros(steps, dtype=dtype)
+    order = np.zeros(steps, dtype=dtype)
+    releases = np.zeros(steps, dtype=np.uint8)
+    driver_values = np.zeros(steps, dtype=dtype)
+    theta_arr = scenario.theta_arr.astype(dtype)
+    reset_arr = scenario.reset_arr.astype(dtype)
+    delta_arr = scenario.delta_arr.astype(dtype)
+
+    driver = scenario.driver
+    mode, base, leak = _precompute_driver(driver, times)
+    if driver.noise_std > 0.0:
+        base = base + rng.standard_normal(steps) * driver.noise_std
+    base = base.astype(dtype, copy=False)
+    # one compiled kernel per drive form; deterministic constant drives skip
+    # the per-step drive table entirely
+    run = _RUN_KERNELS[mode, base.shape[0] > 1]
+
+    event_idx = np.empty(steps, dtype=np.int64)
+    event_theta = np.empty(steps, dtype=dtype)
+    event_reset = np.empty(steps, dtype=dtype)
+    event_delta = np.empty(steps, dtype=dtype)
+    event_sb = np.empty(steps, dtype=dtype)
+    event_sa = np.empty(steps, dtype=dtype)
+
+    n_events = run(
+        real(leak),
+        base,
+        real(scenario.dt),
+        steps,
+        real(scenario.initial_state),
+        theta_arr,
+        reset_arr,
+        delta_arr,
+        x,
+        order,
+        releases,
+        driver_values,
+        event_idx,
+        event_theta,
+        event_reset,
+        event_delta,
+        event_sb,
+        event_sa,
+    )
 
     driver_values[-1] = driver_values[-2] if steps > 1 else 0.0
 
+    events = EventLog(
+        time=times[event_idx[:n_events]],
+        theta=event_theta[:n_events].copy(),
+        reset=event_reset[:n_events].copy(),
+        delta_s=event_delta[:n_events].copy(),
+        state_before=event_sb[:n_events].copy(),
+        state_after=event_sa[:n_events].copy(),
+    )
+    return SimResult(
+        time=times,
+        accumulator=x,
+        order_parameter=order,
+        driver=driver_values,
+        release=releases,
+        events=events,
+    )
+
+
+def simulate_cycle(
+    scenario: Scenario,
+    seed: int | None = None,
+    dtype: np.dtype = np.float64,
+) -> Tuple[pd.DataFrame, EventLog]:
+    """Simulate a single accumulate–release trajectory for the provided scenario.
+
+    Wraps :func:`simulate_cycle_arrays` and returns the trajectory as a
+    DataFrame together with the release events.
+    """
+
+    result = simulate_cycle_arrays(scenario, seed=seed, dtype=dtype)
     frame = pd.DataFrame(
         {
-            "time": times,
-            "accumulator": x,
-            "order_parameter": order,
-            "driver": driver_values,
-            "release": releases,
+            "time": result.time,
+            "accumulator": result.accumulator,
+            "order_parameter": result.order_parameter,
+            "driver": result.driver,
+            "release": result.release,
         }
     )
-    return frame, events
+    return frame, result.events
 
 
-def simulate_ensemble(
+def simulate_batch(
+    scenarios: Sequence[Scenario],
+    seed: int | None = None,
+    max_workers: int | None = None,
+    dtype: np.dtype = np.float64,
+) -> List[SimResult]:
+    """Simulate several independent scenarios concurrently.
+
+    Unlike :func:`simulate_ensemble_arrays` the scenarios may differ in
+    duration or time step. Each one runs through :func:`simulate_cycle_arrays`
+    on a thread pool; the compiled kernels release the GIL, so trajectories
+    integrate in parallel. Per-scenario seeds are drawn from ``seed`` up
+    front, so results do not depend on scheduling.
+    """
+
+    rng = np.random.default_rng(seed)
+    seeds = rng.integers(0, 2**32 - 1, size=len(scenarios))
+    with ThreadPoolExecutor(max_workers=max_workers or os.cpu_count()) as executor:
+        return list(executor.map(partial(simulate_cycle_arrays, dtype=dtype), scenarios, seeds))
+
+
+def simulate_ensemble_arrays(
     scenario: Scenario,
     size: int,
     jitter: Dict[str, float] | None = None,
     seed: int | None = None,
-) -> List[pd.DataFrame]:
-    """Simulate an ensemble of trajectories with optional parameter jitter."""
+    dtype: np.dtype = np.float64,
+) -> Dict[str, np.ndarray]:
+    """Simulate an ensemble of trajectories and return them as stacked arrays.
+
+    ``jitter`` maps ``rate``, ``leak``, ``theta`` and ``reset`` to relative
+    standard deviations applied independently to each member. All members
+    are integrated in one parallel kernel call. The result holds ``time``
+    with shape ``(steps,)`` and ``accumulator``, ``order_parameter``,
+    ``release`` and ``driver`` with shape ``(size, steps)``. ``dtype``
+    selects ``float64`` (default) or ``float32`` state arrays; ``time`` is
+    always ``float64`` and ``release`` always ``uint8``.
+    """
 
+    dtype = _check_dtype(dtype)
+    real = dtype.type
     rng = np.random.default_rng(seed)
-    results: List[pd.DataFrame] = []
     jitter = jitter or {}
-    for index in range(size):
-        # shallow copy scenario parameters with perturbations on rate/leak/reset
-        rate_scale = 1.0 + rng.normal(scale=jitter.get("rate", 0.0))
-        leak_scale = 1.0 + rng.normal(scale=jitter.get("leak", 0.0))
-        thresholds: List[ThresholdSpec] = []
-        for th in scenario.thresholds:
-            theta = th.theta * (1.0 + rng.normal(scale=jitter.get("theta", 0.0)))
-            reset = th.reset * (1.0 + rng.normal(scale=jitter.get("reset", 0.0)))
-            delta_s = th.delta_s
-            thresholds.append(ThresholdSpec(theta=theta, reset=reset, delta_s=delta_s))
-        driver = scenario.driver
-        driver_copy = DriverSpec(
-            type=driver.type,
-            rate=(driver.rate * rate_scale) if driver.rate is not None else None,
-            leak=(driver.leak * leak_scale) if driver.leak is not None else None,
-            segments=driver.segments,
-            noise_std=driver.noise_std,
-        )
-        perturbed = Scenario(
-            id=f"{scenario.id}_member{index}",
-            label=scenario.label,
-            description=scenario.description,
-            dt=scenario.dt,
-            duration=scenario.duration,
-            initial_state=scenario.initial_state,
-            driver=driver_copy,
-            thresholds=tuple(thresholds),
+    steps = _step_count(scenario)
+    times = np.arange(steps, dtype=np.float64) * scenario.dt
+    driver = scenario.driver
+    mode, template, leak = _precompute_driver(driver, times)
+    template = np.broadcast_to(template, (steps,))
+
+    # perturbations on rate/leak/theta/reset, drawn for all members at once
+    n_thr = scenario.theta_arr.shape[0]
+    rate_scales = 1.0 + rng.normal(scale=jitter.get("rate", 0.0), size=size)
+    leak_scales = 1.0 + rng.normal(scale=jitter.get("leak", 0.0), size=size)
+    theta_scales = 1.0 + rng.normal(scale=jitter.get("theta", 0.0), size=(size, n_thr))
+    reset_scales = 1.0 + rng.normal(scale=jitter.get("reset", 0.0), size=(size, n_thr))
+
+    # rate jitter applies to leaky and linear drives; piecewise rates are left alone
+    if driver.type != "piecewise":
+        base = template[np.newaxis, :] * rate_scales[:, np.newaxis]
+    else:
+        base = np.tile(template, (size, 1))
+    if driver.noise_std > 0.0:
+        base += rng.standard_normal((size, steps)) * driver.noise_std
+    member_leak = leak * leak_scales
+
+    theta = scenario.theta_arr * theta_scales
+    reset = scenario.reset_arr * reset_scales
+    delta = np.tile(scenario.delta_arr, (size, 1))
+    rank = np.argsort(theta, axis=1, kind="stable")
+    theta = np.ascontiguousarray(np.take_along_axis(theta, rank, axis=1))
+    reset = np.ascontiguousarray(np.take_along_axis(reset, rank, axis=1))
+    delta = np.ascontiguousarray(np.take_along_axis(delta, rank, axis=1))
+
+    out_x = np.zeros((size, steps), dtype=dtype)
+    out_order = np.zeros((size, steps), dtype=dtype)
+    out_release = np.zeros((size, steps), dtype=np.uint8)
+    out_driver = np.zeros((size, steps), dtype=dtype)
+    _ENSEMBLE_KERNELS[mode](
+        member_leak.astype(dtype, copy=False),
+        base.astype(dtype, copy=False),
+        real(scenario.dt),
+        steps,
+        real(scenario.initial_state),
+        theta.astype(dtype, copy=False),
+        reset.astype(dtype, copy=False),
+        delta.astype(dtype, copy=False),
+        out_x,
+        out_order,
+        out_release,
+        out_driver,
+    )
+    if steps > 1:
+        out_driver[:, -1] = out_driver[:, -2]
+
+    return {
+        "time": times,
+        "accumulator": out_x,
+        "order_parameter": out_order,
+        "release": out_release,
+        "driver": out_driver,
+    }
+
+
+def simulate_ensemble(
+    scenario: Scenario,
+    size: int,
+    jitter: Dict[str, float] | None = None,
+    seed: int | None = None,
+    as_frames: bool = True,
+    dtype: np.dtype = np.float64,
+) -> List[pd.DataFrame] | Dict[str, np.ndarray]:
+    """Simulate an ensemble of trajectories with optional parameter jitter.
+
+    Returns one DataFrame per member, tagged with a ``member`` column. Pass
+    ``as_frames=False`` to get the arrays from
+    :func:`simulate_ensemble_arrays` instead.
+    """
+
+    arrays = simulate_ensemble_arrays(scenario, size, jitter=jitter, seed=seed, dtype=dtype)
+    if not as_frames:
+        return arrays
+    return [
+        pd.DataFrame(
+            {
+                "time": arrays["time"],
+                "accumulator": arrays["accumulator"][index],
+                "order_parameter": arrays["order_parameter"][index],
+                "driver": arrays["driver"][index],
+                "release": arrays["release"][index],
+                "member": index,
+            }
         )
-        frame, _ = simulate_cycle(perturbed, seed=rng.integers(0, 2**32 - 1))
-        frame["member"] = index
-        results.append(frame)
-    return results
+        for index in range(size)
+    ]
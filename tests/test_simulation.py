@@ -1,8 +1,25 @@
+import dataclasses
 import math
+import multiprocessing
+import os
+import subprocess
+import sys
+from pathlib import Path
 
-from arg_lab.analysis import summarize_cycles
-from arg_lab.scenarios import load_scenarios
-from arg_lab.simulate import simulate_cycle
+import numpy as np
+import pytest
+
+from arg_lab._kernels import _select_threshold
+from arg_lab.analysis import compute_viability_margin, summarize_cycles
+from arg_lab.scenarios import DriverSpec, load_scenarios
+from arg_lab.simulate import (
+    _precompute_driver,
+    simulate_batch,
+    simulate_cycle,
+    simulate_cycle_arrays,
+    simulate_ensemble,
+    simulate_ensemble_arrays,
+)
 
 
 def _get_scenario(scenario_id: str):
@@ -30,3 +47,191 @@ def test_queue_release_emits_multiple_events():
     cycles = summarize_cycles(frame, events, scenario.initial_state)
     assert len(cycles) == len(events)
     assert (cycles["ramp_amplitude"] > 0).all()
+
+
+def test_loaded_scenarios_do_not_share_segments():
+    queue = _get_scenario("queue_release")
+    queue.driver.segments[0]["rate"] = 99.0
+    reloaded = _get_scenario("queue_release")
+    assert reloaded.driver.segments[0]["rate"] == 0.35
+    assert reloaded.driver.seg_rates[0] == 0.35
+
+
+
+def test_step_crossing_several_thresholds_applies_the_highest():
+    staircase = _get_scenario("staircase_ladder")
+    scenario = dataclasses.replace(staircase, dt=0.5, driver=DriverSpec(type="linear", rate=2.0))
+    _, events = simulate_cycle(scenario)
+    # the second step lands at 2.0, past both 1.2 and 1.9
+    assert events[0].time == 1.0
+    assert events[0].theta == 1.9
+    assert events[0].reset == 0.9
+
+
+def test_select_threshold_matches_searchsorted():
+    theta = np.array([1.2, 1.9, 2.4])
+    values = [0.0, 1.2 - 1e-9, 1.2, 1.5, 1.9, 2.0, 2.4, 3.0, -1.0]
+    for value in values:
+        assert _select_threshold(theta, value) == np.searchsorted(theta, value, side="right") - 1
+
+def test_ensemble_is_reproducible_per_seed():
+    scenario = _get_scenario("staircase_ladder")
+    jitter = {"rate": 0.05, "theta": 0.05}
+    first = simulate_ensemble(scenario, size=4, jitter=jitter, seed=7)
+    second = simulate_ensemble(scenario, size=4, jitter=jitter, seed=7)
+    assert [frame["member"].iloc[0] for frame in first] == [0, 1, 2, 3]
+    for a, b in zip(first, second):
+        assert a.equals(b)
+        assert (a["accumulator"] >= 0).all()
+
+
+def test_ensemble_without_jitter_matches_single_runs():
+    for scenario_id in ("leaky_neuron", "staircase_ladder"):
+        scenario = _get_scenario(scenario_id)
+        frame, _ = simulate_cycle(scenario)
+        arrays = simulate_ensemble_arrays(scenario, size=3, seed=3)
+        for member in range(3):
+            assert np.allclose(arrays["accumulator"][member], frame["accumulator"].to_numpy(), rtol=0, atol=1e-12)
+            assert (arrays["release"][member] == frame["release"].to_numpy()).all()
+            assert (arrays["order_parameter"][member] == frame["order_parameter"].to_numpy()).all()
+
+
+def test_ensemble_order_parameter_steps_only_on_release():
+    scenario = _get_scenario("staircase_ladder")
+    arrays = simulate_ensemble_arrays(scenario, size=4, jitter={"rate": 0.1, "theta": 0.05}, seed=9)
+    for order, release in zip(arrays["order_parameter"], arrays["release"]):
+        assert ((np.diff(order) > 0) == (release[1:] == 1)).all()
+        assert release.sum() > 0
+
+
+def test_leaky_neuron_period_in_single_precision():
+    scenario = _get_scenario("leaky_neuron")
+    frame, events = simulate_cycle(scenario, dtype=np.float32)
+    assert frame["accumulator"].dtype == np.float32
+    assert (frame["time"].to_numpy() == simulate_cycle(scenario)[0]["time"].to_numpy()).all()
+    cycles = summarize_cycles(frame, events, scenario.initial_state)
+    measured_period = cycles["duration"].iloc[0]
+    a = scenario.driver.rate
+    b = scenario.driver.leak
+    expected = (1 / b) * math.log((a / b - scenario.initial_state) / (a / b - scenario.thresholds[0].theta))
+    assert math.isclose(measured_period, expected, rel_tol=0.05)
+
+
+def test_event_log_rows_match_columns():
+    scenario = _get_scenario("staircase_ladder")
+    frame, events = simulate_cycle(scenario)
+    table = events.to_frame()
+    assert len(table) == len(events)
+    assert list(events)[-1] == events[-1]
+    assert table["time"].tolist() == [event.time for event in events]
+    assert summarize_cycles(frame, list(events), 0.0).equals(summarize_cycles(frame, events, 0.0))
+
+
+def test_array_result_matches_frame():
+    scenario = _get_scenario("queue_release")
+    result = simulate_cycle_arrays(scenario, seed=5)
+    frame, events = simulate_cycle(scenario, seed=5)
+    assert (frame["accumulator"].to_numpy() == result.accumulator).all()
+    assert len(result.events) == len(events)
+    assert compute_viability_margin(result, scenario.thresholds) == compute_viability_margin(
+        frame, scenario.thresholds
+    )
+
+
+def test_batch_handles_scenarios_of_different_lengths():
+    scenarios = load_scenarios()
+    first = simulate_batch(scenarios, seed=11, max_workers=2)
+    second = simulate_batch(scenarios, seed=11)
+    assert [result.time.shape[0] for result in first] == [
+        int(math.ceil(scenario.duration / scenario.dt)) + 1 for scenario in scenarios
+    ]
+    for a, b in zip(first, second):
+        assert (a.accumulator == b.accumulator).all()
+
+
+def test_ensemble_rate_jitter_leaves_piecewise_segments_alone():
+    scenario = _get_scenario("queue_release")
+    driver = dataclasses.replace(scenario.driver, rate=1.0, noise_std=0.0)
+    scenario = dataclasses.replace(scenario, driver=driver)
+    arrays = simulate_ensemble_arrays(scenario, size=3, jitter={"rate": 0.2}, seed=1)
+    assert (arrays["driver"] == arrays["driver"][0]).all()
+
+
+def test_event_logs_compare_by_value():
+    scenario = _get_scenario("queue_release")
+    _, first = simulate_cycle(scenario, seed=4)
+    _, second = simulate_cycle(scenario, seed=4)
+    _, other = simulate_cycle(scenario, seed=5)
+    assert first == second
+    assert first == list(second)
+    assert list(first) == second
+    assert first != other
+
+
+def test_piecewise_rate_lookup_at_segment_boundaries():
+    driver = DriverSpec(
+        type="piecewise",
+        segments=({"end": 1.0, "rate": 0.5}, {"end": 2.0, "rate": 1.5}),
+    )
+    times = np.array([0.0, 1.0, np.nextafter(1.0, 2.0), 2.0, np.nextafter(2.0, 3.0), 5.0])
+    # a segment covers times up to and including its end; past the last end keeps its rate
+    expected = np.array([0.5, 0.5, 1.5, 1.5, 1.5, 1.5])
+    _, base, _ = _precompute_driver(driver, times)
+    assert (base == expected).all()
+
+
+
+def test_piecewise_segments_must_be_in_increasing_order():
+    with pytest.raises(ValueError, match="strictly increasing"):
+        DriverSpec(type="piecewise", segments=({"end": 20.0, "rate": 0.5}, {"end": 10.0, "rate": 0.35}))
+    with pytest.raises(ValueError, match="strictly increasing"):
+        DriverSpec(type="piecewise", segments=({"end": 10.0, "rate": 0.5}, {"end": 10.0, "rate": 0.35}))
+
+_CACHE_PROBE = """
+import numpy as np
+from arg_lab import _kernels, load_scenarios, simulate_ensemble_arrays
+# the ensemble kernels compile lazily, so run them in every mode and precision first
+for scenario in load_scenarios()[:2]:
+    for dtype in (np.float32, np.float64):
+        simulate_ensemble_arrays(scenario, size=2, seed=0, dtype=dtype)
+dispatchers = [_kernels._select_threshold, *_kernels._RUN_KERNELS.values(), *_kernels._ENSEMBLE_KERNELS.values()]
+print(sum(sum(d.stats.cache_misses.values()) for d in dispatchers))
+"""
+
+
+def test_compiled_kernels_load_from_cache_in_a_new_process():
+    pytest.importorskip("numba")
+    root = Path(__file__).resolve().parents[1]
+    env = {**os.environ, "PYTHONPATH": str(root)}
+
+    def misses() -> int:
+        probe = subprocess.run(
+            [sys.executable, "-c", _CACHE_PROBE], cwd=root, env=env, capture_output=True, text=True, check=True
+        )
+        return int(probe.stdout.strip().splitlines()[-1])
+
+    misses()  # populate the cache if this checkout has not compiled yet
+    assert misses() == 0
+
+
+_FORK_PROBE = """
+import multiprocessing
+from arg_lab import load_scenarios, simulate_cycle
+
+def count_events(scenario):
+    return len(simulate_cycle(scenario, seed=0)[1])
+
+if __name__ == "__main__":
+    with multiprocessing.get_context("fork").Pool(2) as pool:
+        print(pool.map(count_events, load_scenarios()))
+"""
+
+
+def test_import_leaves_forked_workers_able_to_exit():
+    if "fork" not in multiprocessing.get_all_start_methods():
+        pytest.skip("fork start method unavailable")
+    root = Path(__file__).resolve().parents[1]
+    env = {**os.environ, "PYTHONPATH": str(root)}
+    # importing the package must not start the parallel threading layer,
+    # which leaves forked processes hanging at exit
+    subprocess.run([sys.executable, "-c", _FORK_PROBE], cwd=root, env=env, check=True, timeout=60)